@@ -3,123 +3,222 @@
 This router exposes CRUD and search endpoints for events. Query parameters
 support keyword search, location and category filters, date range filtering,
 sorting, pagination, and a total-count response header.
+
+Handlers are ``async``; the blocking SQLite work runs in a worker thread via
+:func:`asyncio.to_thread` so the event loop stays free while queries run.
 """
 
-from datetime import date as _date
+import asyncio
 import sqlite3
-from typing import List, Optional
+from datetime import date as _date
+from typing import Annotated, Any, TypeVar
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import to_json
 
-from ...core.database import get_db
+from ...core.database import get_db, run_and_commit
 from ...repositories.events import (
-    count_events,
     delete_event,
     get_event,
     insert_event,
-    list_events,
+    search_and_count,
     update_event,
 )
 from ...schemas.event import (
-    CategoryEnum,
-    EventCreate,
+    CategoryValue,
+    EventFilter,
     EventOut,
-    EventQuery,
-    EventUpdate,
-    SortEnum,
+    SortValue,
+    event_create_adapter,
+    event_update_adapter,
 )
 
+router = APIRouter(prefix="/events", tags=["events"])
+
+_KEYSET_SORTS = ("date_asc", "date_desc")
 
-def _parse_iso_date(value: Optional[str]) -> Optional[_date]:
-    if value is None:
-        return None
-    return _date.fromisoformat(value)
 
+_T = TypeVar("_T")
 
-router = APIRouter(prefix="/events", tags=["events"])
+
+def _parse_body(adapter: TypeAdapter[_T], body: bytes) -> _T:
+    """Parse and validate a raw JSON body in a single pydantic-core call.
+
+    Errors are reported like FastAPI's own body validation (422, ``loc``
+    starting with ``"body"``).
+    """
+    try:
+        return adapter.validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [
+                {**err, "loc": ("body", *err["loc"])}
+                for err in e.errors(include_url=False)
+            ]
+        ) from None
+
+
+def _body_schema(adapter: TypeAdapter[Any]) -> dict[str, Any]:
+    """OpenAPI ``requestBody`` for handlers that read the raw body themselves."""
+    schema = adapter.json_schema(ref_template="#/components/schemas/{model}")
+    # Referenced enums (CategoryEnum) are already components via EventOut.
+    schema.pop("$defs", None)
+    content = {"application/json": {"schema": schema}}
+    return {"requestBody": {"required": True, "content": content}}
+
+
+def _json_response(evt: EventOut, status_code: int = 200) -> Response:
+    # Returning a Response skips FastAPI's response_model validation pass.
+    return Response(
+        content=evt.model_dump_json(),
+        media_type="application/json",
+        status_code=status_code,
+    )
 
 
-@router.post("/", response_model=EventOut, status_code=201)
-def create_event(payload: EventCreate, conn: sqlite3.Connection = Depends(get_db)) -> EventOut:
+@router.post(
+    "/",
+    response_model=EventOut,
+    status_code=201,
+    openapi_extra=_body_schema(event_create_adapter),
+)
+async def create_event(
+    request: Request, conn: sqlite3.Connection = Depends(get_db)
+) -> Response:
     """Create a new event.
 
+    The body is validated as :class:`EventCreate` straight from the request
+    bytes, and the response is serialized by pydantic-core.
+
     Args:
-        payload: Validated event payload.
+        request: Incoming request; its body is the event payload.
         conn: Database connection (injected).
 
     Returns:
         The newly created event.
     """
-    return insert_event(conn, payload)
-
-
-@router.get("/", response_model=List[EventOut])
-def search_events(
-    response: Response,
-    q: Optional[str] = Query(None, description="Keyword in title/description"),
-    starts_with: Optional[str] = Query(None, pattern=r"^[A-Za-z]$", description="Filter by first letter of title"),
-    location: Optional[str] = None,
-    date: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}-\d{2}$"),
-    category: Optional[CategoryEnum] = None,
-    start_date: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}-\d{2}$"),
-    end_date: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}-\d{2}$"),
+    payload = _parse_body(event_create_adapter, await request.body())
+    evt = await asyncio.to_thread(run_and_commit, conn, insert_event, payload)
+    return _json_response(evt, status_code=201)
+
+
+@router.get("/", response_model=list[EventOut])
+async def search_events(
+    q: str | None = Query(None, description="Keyword in title/description"),
+    starts_with: str | None = Query(
+        None, pattern=r"^[A-Za-z]$", description="Filter by first letter of title"
+    ),
+    location: str | None = None,
+    date: Annotated[_date | None, Query(description="Exact date (YYYY-MM-DD)")] = None,
+    category: CategoryValue | None = None,
+    start_date: _date | None = None,
+    end_date: _date | None = None,
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    sort: SortEnum = SortEnum.date_asc,
+    sort: Annotated[
+        SortValue | None,
+        Query(description="Defaults to relevance when q is set, else date_asc"),
+    ] = None,
+    after_date: Annotated[
+        _date | None, Query(description="Cursor: date of the last seen event")
+    ] = None,
+    after_id: int | None = Query(
+        None, ge=1, description="Cursor: id of the last seen event"
+    ),
     conn: sqlite3.Connection = Depends(get_db),
-) -> List[EventOut]:
+) -> Response:
     """Search and paginate events.
 
-    Sets ``X-Total-Count`` header to the total number of matches.
+    Rows are serialized to JSON directly from the database values; the
+    ``response_model`` only documents their shape.
+
+    Sets ``X-Total-Count`` header to the total number of matches. For date
+    sorts, a full page also sets ``X-Next-Cursor`` to the query parameters
+    (``after_date=...&after_id=...``) that fetch the next page by keyset
+    instead of ``offset``.
     """
-    parsed = EventQuery(
+    cursor = after_date is not None or after_id is not None
+    if cursor and (after_date is None or after_id is None):
+        raise HTTPException(
+            status_code=422, detail="after_date and after_id must be given together"
+        )
+    if sort is None:
+        sort = "relevance" if q and not cursor else "date_asc"
+    if cursor and sort not in _KEYSET_SORTS:
+        raise HTTPException(
+            status_code=422,
+            detail="after_date/after_id require sort=date_asc or date_desc",
+        )
+    parsed = EventFilter(
         q=q,
         starts_with=starts_with,
         location=location,
-        date=_parse_iso_date(date),
+        date=date,
         category=category,
-        start_date=_parse_iso_date(start_date),
-        end_date=_parse_iso_date(end_date),
+        start_date=start_date,
+        end_date=end_date,
         limit=limit,
         offset=offset,
         sort=sort,
+        after_date=after_date,
+        after_id=after_id,
+    )
+    items, total = await asyncio.to_thread(search_and_count, conn, parsed)
+    headers = {"X-Total-Count": str(total)}
+    if sort in _KEYSET_SORTS and len(items) == limit:
+        last = items[-1]
+        headers["X-Next-Cursor"] = f"after_date={last['date']}&after_id={last['id']}"
+    return Response(
+        content=to_json(items), media_type="application/json", headers=headers
     )
-    total = count_events(conn, parsed)
-    if response is not None:
-        response.headers["X-Total-Count"] = str(total)
-    return list_events(conn, parsed)
 
 
 @router.get("/{event_id}", response_model=EventOut)
-def get_event_by_id(event_id: int, conn: sqlite3.Connection = Depends(get_db)) -> EventOut:
+async def get_event_by_id(
+    event_id: int, conn: sqlite3.Connection = Depends(get_db)
+) -> Response:
     """Get a single event by ID.
 
-    Raises 404 if the event is not found.
+    Raises 404 if the event is not found. The event is serialized as built
+    from the row; ``response_model`` only documents it.
     """
-    evt = get_event(conn, event_id)
+    evt = await asyncio.to_thread(get_event, conn, event_id)
     if not evt:
         raise HTTPException(status_code=404, detail="Event not found")
-    return evt
+    return _json_response(evt)
 
 
-@router.patch("/{event_id}", response_model=EventOut)
-def patch_event(event_id: int, payload: EventUpdate, conn: sqlite3.Connection = Depends(get_db)) -> EventOut:
+@router.patch(
+    "/{event_id}",
+    response_model=EventOut,
+    openapi_extra=_body_schema(event_update_adapter),
+)
+async def patch_event(
+    event_id: int, request: Request, conn: sqlite3.Connection = Depends(get_db)
+) -> Response:
     """Partially update an event.
 
     Only provided fields are updated. Raises 404 if not found.
     """
-    updated = update_event(conn, event_id, payload)
+    payload = _parse_body(event_update_adapter, await request.body())
+    updated = await asyncio.to_thread(
+        run_and_commit, conn, update_event, event_id, payload
+    )
     if not updated:
         raise HTTPException(status_code=404, detail="Event not found")
-    return updated
+    return _json_response(updated)
 
 
 @router.delete("/{event_id}", status_code=204)
-def delete_event_by_id(event_id: int, conn: sqlite3.Connection = Depends(get_db)) -> None:
+async def delete_event_by_id(
+    event_id: int, conn: sqlite3.Connection = Depends(get_db)
+) -> None:
     """Delete an event by ID.
 
     Returns 204 on success; raises 404 if not found.
     """
-    ok = delete_event(conn, event_id)
+    ok = await asyncio.to_thread(run_and_commit, conn, delete_event, event_id)
     if not ok:
         raise HTTPException(status_code=404, detail="Event not found")
@@ -1,14 +1,17 @@
 """Miscellaneous metadata endpoints (e.g., category list)."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
 from ...schemas.event import CategoryEnum
 
-
 router = APIRouter(prefix="/meta", tags=["meta"])
 
+# Categories are fixed at import time; build the (immutable) response once.
+_CATEGORIES = tuple(c.value for c in CategoryEnum)
+
 
 @router.get("/categories", response_model=list[str])
-def list_categories() -> list[str]:
+async def list_categories(response: Response) -> tuple[str, ...]:
     """Return all supported event categories as strings."""
-    return [c.value for c in CategoryEnum]
+    response.headers["Cache-Control"] = "public, max-age=3600"
+    return _CATEGORIES
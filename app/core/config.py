@@ -4,7 +4,8 @@ Uses pydantic-settings to load values from environment and optional ``.env``.
 Prefix: ``EVENTFINDER_`` (e.g., ``EVENTFINDER_DATABASE_PATH``).
 """
 
-from typing import List
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -12,7 +13,7 @@ class Settings(BaseSettings):
     """Runtime settings for the API service."""
     app_name: str = "Event Finder API"
     database_path: str = "./event_finder.db"
-    backend_cors_origins: List[str] = [
+    backend_cors_origins: list[str] = [
         "http://localhost:8000",
         "http://127.0.0.1:8000",
         "http://0.0.0.0:8000",
@@ -26,4 +27,7 @@ class Settings(BaseSettings):
     )
 
 
-settings = Settings()
+@lru_cache
+def get_settings() -> Settings:
+    """Return the process-wide settings, read from the environment on first use."""
+    return Settings()
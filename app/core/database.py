@@ -1,54 +1,101 @@
 """SQLite connection helpers and FastAPI DB dependencies.
 
 This module centralizes SQLite connection configuration, a contextmanager for
-scripted sessions, a FastAPI dependency for request-scoped connections, and
-database initialization (DDL and indexes).
+scripted sessions, a bounded connection pool backing the FastAPI dependency
+for request-scoped connections, and database initialization (DDL and indexes).
 """
 
+import asyncio
+import logging
 import os
+import queue
 import sqlite3
+import threading
 import time
+from collections.abc import AsyncIterator, Callable, Iterator
 from contextlib import contextmanager
-import logging
 from pathlib import Path
-from typing import Iterator
+from typing import Any, TypeVar
+
+from fastapi import Request
+
+from .config import get_settings
 
-from .config import settings
 
+def _default_path() -> Path:
+    return Path(get_settings().database_path)
 
-DB_PATH = Path(settings.database_path)
 
+class AppConnection(sqlite3.Connection):
+    """SQLite connection carrying capabilities probed once at connect time."""
 
-def _connect() -> sqlite3.Connection:
+    fts_available: bool = False
+
+
+def _probe_fts(conn: sqlite3.Connection) -> bool:
+    try:
+        cur = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='events_fts'"
+        )
+        return cur.fetchone() is not None
+    except sqlite3.Error:
+        return False
+
+
+def _connect(path: Path) -> sqlite3.Connection:
     """Create a SQLite connection with sensible defaults for web apps.
 
     - ``row_factory`` returns dict-like rows
+    - ``isolation_level=None``: no implicit transactions; sessions issue
+      ``BEGIN`` themselves so transaction boundaries are explicit
+    - ``cached_statements`` is sized for every search SQL shape in use
     - ``busy_timeout`` prevents immediate "database is locked" errors
     - ``journal_mode=WAL`` improves concurrent readers
     - ``synchronous=NORMAL`` balances durability/perf for web traffic
+    - ``cache_size``/``mmap_size``/``temp_store`` keep hot pages and sort
+      scratch space in memory instead of going through read syscalls
+    - ``fts_available`` records whether the FTS5 table exists, so searches
+      don't re-query ``sqlite_master`` per request
     """
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(
+        path,
+        check_same_thread=False,
+        factory=AppConnection,
+        isolation_level=None,
+        cached_statements=512,
+    )
     conn.row_factory = sqlite3.Row
     try:
         conn.execute("PRAGMA busy_timeout=5000")
-        conn.execute("PRAGMA journal_mode=WAL")
+        mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()
+        if not mode or str(mode[0]).lower() != "wal":
+            logging.getLogger(__name__).warning(
+                "SQLite journal_mode is %r, not WAL; concurrent writes will be slower",
+                mode[0] if mode else None,
+            )
         conn.execute("PRAGMA synchronous=NORMAL")
         conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
     except sqlite3.Error:
         # Pragmas are best-effort and platform dependent; ignore failures
         pass
+    conn.fts_available = _probe_fts(conn)
     return conn
 
 
 @contextmanager
-def db_session() -> Iterator[sqlite3.Connection]:
+def db_session(path: Path | None = None) -> Iterator[sqlite3.Connection]:
     """Context-managed DB session for scripts and CLIs.
 
-    Commits on success, rolls back on exception, and always closes the
-    connection.
+    Opens ``path`` (default: the configured database). Runs in one
+    transaction: commits on success, rolls back on exception, and always
+    closes the connection.
     """
-    conn = _connect()
+    conn = _connect(path or _default_path())
     try:
+        conn.execute("BEGIN")
         yield conn
         conn.commit()
     except Exception:
@@ -58,79 +105,329 @@ def db_session() -> Iterator[sqlite3.Connection]:
         conn.close()
 
 
-def get_db() -> Iterator[sqlite3.Connection]:
-    """FastAPI dependency yielding a DB connection.
+class ConnectionPool:
+    """Small bounded pool of pre-configured SQLite connections.
 
-    Request-scoped: commits on success, rolls back on exception, then closes.
+    Connections are opened lazily via :func:`_connect` (so pragmas run once per
+    connection, not once per request) and handed out one request at a time.
+    At most ``max_size`` connections exist; callers block when all are in use.
+    Every connection the pool opens is tracked, so :meth:`close` also reaches
+    ones still checked out.
     """
-    conn = _connect()
+
+    def __init__(self, path: Path, min_size: int = 2, max_size: int = 10) -> None:
+        self.path = path
+        self.min_size = min_size
+        self.max_size = max_size
+        self._idle: queue.SimpleQueue[sqlite3.Connection] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._size = 0
+        self._conns: set[sqlite3.Connection] = set()
+
+    def _open_one(self) -> sqlite3.Connection:
+        # Caller has reserved the slot in ``_size``.
+        conn = _connect(self.path)
+        with self._lock:
+            self._conns.add(conn)
+        return conn
+
+    def open(self) -> None:
+        """Pre-open ``min_size`` connections."""
+        while True:
+            with self._lock:
+                if self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                self._idle.put(self._open_one())
+            except Exception:
+                with self._lock:
+                    self._size -= 1
+                raise
+
+    def acquire(self) -> sqlite3.Connection:
+        """Check out a connection, opening a new one if below ``max_size``."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            reserved = self._size < self.max_size
+            if reserved:
+                self._size += 1
+        if reserved:
+            try:
+                return self._open_one()
+            except Exception:
+                with self._lock:
+                    self._size -= 1
+                raise
+        return self._idle.get()
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a healthy connection to the pool."""
+        with self._lock:
+            if conn not in self._conns:
+                # Already closed by :meth:`close`.
+                return
+        self._idle.put(conn)
+
+    def discard(self, conn: sqlite3.Connection) -> None:
+        """Close a broken connection and free its slot."""
+        with self._lock:
+            if conn not in self._conns:
+                return
+            self._conns.discard(conn)
+            self._size -= 1
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Close every connection the pool has opened.
+
+        Waits up to ``timeout`` seconds for checked-out connections to be
+        released, then closes any still out as well.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                if not self._conns:
+                    return
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                self.discard(self._idle.get(timeout=remaining))
+            except queue.Empty:
+                break
+        with self._lock:
+            leftover = list(self._conns)
+        for conn in leftover:
+            self.discard(conn)
+
+
+# Requests that only read; they get a deferred ``BEGIN`` at checkout so all of
+# their statements see one snapshot. Write requests take the write lock later,
+# in :func:`run_and_commit`, once the request body has been read.
+_READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def _checkout(pool: ConnectionPool, begin: bool) -> sqlite3.Connection:
+    conn = pool.acquire()
+    if begin:
+        try:
+            conn.execute("BEGIN")
+        except BaseException:
+            pool.discard(conn)
+            raise
+    return conn
+
+
+def _checkin(pool: ConnectionPool, conn: sqlite3.Connection, broken: bool) -> None:
+    if not broken and conn.in_transaction:
+        try:
+            conn.rollback()
+        except sqlite3.Error:
+            broken = True
+    if broken:
+        pool.discard(conn)
+    else:
+        pool.release(conn)
+
+
+async def get_db(request: Request) -> AsyncIterator[sqlite3.Connection]:
+    """FastAPI dependency yielding a pooled DB connection.
+
+    Read requests (:data:`_READ_METHODS`) run in a ``BEGIN`` transaction
+    opened on checkout; write handlers open and commit their own through
+    :func:`run_and_commit`. Nothing is committed here: this teardown runs
+    after the response is sent. Whatever is left open is rolled back, then
+    the connection goes back to the app's pool (``app.state.pool``).
+    Connections that hit a low-level :class:`sqlite3.DatabaseError` (e.g.
+    corruption) are closed instead of being reused; constraint and lock
+    errors leave the connection intact.
+
+    The dependency is ``async`` so it doesn't occupy a threadpool slot for
+    the whole request; checkout and checkin run via :func:`asyncio.to_thread`
+    and are shielded, so a cancelled request still returns its connection.
+    """
+    pool: ConnectionPool = request.app.state.pool
+    begin = request.method in _READ_METHODS
+    checkout = asyncio.ensure_future(asyncio.to_thread(_checkout, pool, begin))
+    try:
+        conn = await asyncio.shield(checkout)
+    except asyncio.CancelledError:
+        checkout.add_done_callback(
+            lambda t: None
+            if t.cancelled() or t.exception()
+            else _checkin(pool, t.result(), False)
+        )
+        raise
+    broken = False
     try:
         yield conn
+    except sqlite3.DatabaseError as e:
+        broken = not isinstance(e, (sqlite3.IntegrityError, sqlite3.OperationalError))
+        raise
+    finally:
+        await asyncio.shield(asyncio.to_thread(_checkin, pool, conn, broken))
+
+
+_R = TypeVar("_R")
+
+
+def run_and_commit(conn: sqlite3.Connection, fn: Callable[..., _R], *args: Any) -> _R:
+    """Call ``fn(conn, *args)`` in a ``BEGIN IMMEDIATE`` transaction and commit.
+
+    Write handlers run this inside ``asyncio.to_thread`` once the request body
+    is validated, so the write lock is held only for the write itself (taken
+    up front, it waits out ``busy_timeout`` rather than failing on upgrade),
+    and a failed COMMIT surfaces as an error response.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        result = fn(conn, *args)
         conn.commit()
-    except Exception:
+    except BaseException:
         conn.rollback()
         raise
-    finally:
-        conn.close()
+    return result
+
+
+def optimize_db(path: Path | None = None) -> None:
+    """Refresh planner statistics and merge FTS segments; run at shutdown."""
+    try:
+        with db_session(path) as conn:
+            conn.execute("PRAGMA optimize")
+            if getattr(conn, "fts_available", False):
+                conn.execute(
+                    "INSERT INTO events_fts(events_fts, rank) VALUES('merge', -500)"
+                )
+    except sqlite3.Error:
+        logging.getLogger(__name__).warning("PRAGMA optimize failed", exc_info=True)
+
+
+# Bump when the events_fts definition changes; init_db then recreates and
+# rebuilds the index. Stored in ``PRAGMA user_version``.
+# 1: title/description/location columns; 2: porter tokenizer + prefix indexes;
+# 3: porter dropped (stemming broke prefix queries on partial words).
+FTS_SCHEMA_VERSION = 3
+
+# Kept separate so bulk loaders can drop the per-row trigger and restore it.
+FTS_INSERT_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS events_fts_ai AFTER INSERT ON events BEGIN
+  INSERT INTO events_fts(rowid, title, description, location)
+  VALUES (new.id, new.title, new.description, new.location);
+END;
+"""
 
 
 def _ensure_fts5(conn: sqlite3.Connection) -> None:
     """Create FTS5 virtual table and triggers if available.
 
-    Attempts to create an external-content FTS5 table to index title and
-    description. If FTS5 isn't compiled in, exits quietly.
+    Attempts to create an external-content FTS5 table to index title,
+    description and location, accent-folded, with prefix indexes so short
+    prefix queries (``la*``, ``lag*``) are a lookup. Terms are not stemmed:
+    every search word is a prefix query, and stemming would cut indexed words
+    shorter than a partially typed one (``festiva*`` vs ``festiv``). A
+    table from an older :data:`FTS_SCHEMA_VERSION` is dropped and recreated.
+    Whenever the index doesn't cover every event
+    (new table over existing data, or a previous crash), it is rebuilt in bulk
+    from ``events``. If SQLite wasn't compiled with FTS5, exits quietly
+    without attempting any FTS statements.
     """
     cur = conn.cursor()
-    try:
-        cur.execute(
-            """
-            CREATE VIRTUAL TABLE IF NOT EXISTS events_fts
-            USING fts5(
-              title,
-              description,
-              content='events',
-              content_rowid='id'
-            )
-            """
-        )
-        # Triggers to keep FTS in sync
-        cur.execute(
-            """
-            CREATE TRIGGER IF NOT EXISTS events_fts_ai AFTER INSERT ON events BEGIN
-              INSERT INTO events_fts(rowid, title, description)
-              VALUES (new.id, new.title, new.description);
-            END;
-            """
-        )
-        cur.execute(
-            """
-            CREATE TRIGGER IF NOT EXISTS events_fts_ad AFTER DELETE ON events BEGIN
-              INSERT INTO events_fts(events_fts, rowid, title, description)
-              VALUES('delete', old.id, old.title, old.description);
-            END;
-            """
-        )
-        cur.execute(
-            """
-            CREATE TRIGGER IF NOT EXISTS events_fts_au AFTER UPDATE ON events BEGIN
-              INSERT INTO events_fts(events_fts, rowid, title, description)
-              VALUES('delete', old.id, old.title, old.description);
-              INSERT INTO events_fts(rowid, title, description)
-              VALUES (new.id, new.title, new.description);
-            END;
-            """
+    cur.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+    if not cur.fetchone()[0]:
+        logging.getLogger(__name__).info("SQLite FTS5 not available; continuing without full-text index")
+        return
+
+    version = cur.execute("PRAGMA user_version").fetchone()[0]
+    if version < FTS_SCHEMA_VERSION:
+        for trigger in ("events_fts_ai", "events_fts_ad", "events_fts_au"):
+            cur.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        cur.execute("DROP TABLE IF EXISTS events_fts")
+    cur.execute(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS events_fts
+        USING fts5(
+          title,
+          description,
+          location,
+          content='events',
+          content_rowid='id',
+          tokenize='unicode61 remove_diacritics 2',
+          prefix='2 3 4'
         )
-    except sqlite3.OperationalError as e:
-        # If FTS5 is not available, ignore. Other errors bubble up.
-        if 'fts5' in str(e).lower():
-            logging.getLogger(__name__).info("SQLite FTS5 not available; continuing without full-text index")
-            return
-        raise
+        """
+    )
+    cur.execute(f"PRAGMA user_version = {FTS_SCHEMA_VERSION}")
+    # Default ``rank`` for MATCH queries: BM25 weighting title matches
+    # above description matches; location is a filter, not a relevance signal.
+    cur.execute(
+        "INSERT INTO events_fts(events_fts, rank)"
+        " VALUES('rank', 'bm25(3.0, 1.0, 0.0)')"
+    )
+    # Triggers to keep FTS in sync
+    cur.execute(FTS_INSERT_TRIGGER)
+    cur.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS events_fts_ad AFTER DELETE ON events BEGIN
+          INSERT INTO events_fts(events_fts, rowid, title, description, location)
+          VALUES('delete', old.id, old.title, old.description, old.location);
+        END;
+        """
+    )
+    cur.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS events_fts_au AFTER UPDATE ON events BEGIN
+          INSERT INTO events_fts(events_fts, rowid, title, description, location)
+          VALUES('delete', old.id, old.title, old.description, old.location);
+          INSERT INTO events_fts(rowid, title, description, location)
+          VALUES (new.id, new.title, new.description, new.location);
+        END;
+        """
+    )
+    # events_fts_docsize has one row per indexed event; COUNT(*) on the
+    # external-content table itself would read ``events``.
+    indexed = cur.execute("SELECT COUNT(*) FROM events_fts_docsize").fetchone()[0]
+    total = cur.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+    if indexed != total:
+        cur.execute("INSERT INTO events_fts(events_fts) VALUES('rebuild')")
+
+
+# Columns added after the original schema, created via ALTER TABLE on older
+# databases. SQLite can only add VIRTUAL generated columns that way, which is
+# all the indexes need.
+_ADDED_COLUMNS = {
+    # Day number equal to ``datetime.date.toordinal()``: integer date predicates
+    # and a smaller index than the ISO text.
+    "date_i": "INTEGER GENERATED ALWAYS AS"
+    " (CAST(julianday(date) - 1721424.5 AS INTEGER)) VIRTUAL",
+    # Lower-cased first letter of the title: A–Z browsing is an equality seek.
+    "title_initial": "TEXT GENERATED ALWAYS AS (LOWER(SUBSTR(title, 1, 1))) VIRTUAL",
+}
+
+# Indexes replaced by the ones created in ``_create_schema``.
+_SUPERSEDED_INDEXES = (
+    "idx_events_date",
+    "idx_events_category",
+    "idx_events_created",
+    "idx_events_location",
+    "idx_events_date_id",
+    "idx_events_cat_date",
+    "idx_events_title",
+    # The location LIKE fallback matches any word, so it can't seek this.
+    "idx_events_location_nocase",
+)
 
 
 def _create_schema(conn: sqlite3.Connection) -> None:
-    """Create core tables and indexes."""
+    """Create core tables and indexes in a single transaction."""
     cur = conn.cursor()
+    cur.execute("BEGIN IMMEDIATE")
     cur.execute(
         """
         CREATE TABLE IF NOT EXISTS events (
@@ -144,12 +441,28 @@ def _create_schema(conn: sqlite3.Connection) -> None:
         )
         """
     )
-    # Helpful indexes for search and sorting
-    cur.execute("CREATE INDEX IF NOT EXISTS idx_events_date ON events(date)")
-    cur.execute("CREATE INDEX IF NOT EXISTS idx_events_category ON events(LOWER(category))")
-    cur.execute("CREATE INDEX IF NOT EXISTS idx_events_location ON events(LOWER(location))")
-    cur.execute("CREATE INDEX IF NOT EXISTS idx_events_created ON events(created_at)")
-    cur.execute("CREATE INDEX IF NOT EXISTS idx_events_title ON events(LOWER(title))")
+    existing = {row[1] for row in cur.execute("PRAGMA table_xinfo(events)")}
+    for name, ddl in _ADDED_COLUMNS.items():
+        if name not in existing:
+            cur.execute(f"ALTER TABLE events ADD COLUMN {name} {ddl}")
+    for name in _SUPERSEDED_INDEXES:
+        cur.execute(f"DROP INDEX IF EXISTS {name}")
+    # Helpful indexes for search and sorting. Composite indexes end in the
+    # sort key so filtered, ordered pages are an index range walk rather than
+    # a temp B-tree sort.
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_events_datei_id ON events(date_i, id)")
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_events_cat_datei"
+        " ON events(LOWER(category), date_i, id)"
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_events_created_id"
+        " ON events(created_at DESC, id DESC)"
+    )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_events_title_initial"
+        " ON events(title_initial, date_i, id)"
+    )
     _ensure_fts5(conn)
     conn.commit()
 
@@ -165,36 +478,39 @@ def _integrity_ok(conn: sqlite3.Connection) -> bool:
         return False
 
 
-def init_db() -> None:
+def init_db(path: Path | None = None) -> None:
     """Create database and schema; optionally auto-repair if corrupted.
 
-    If ``EVENTFINDER_DB_AUTOREPAIR`` is set to a truthy value ("1", "true",
+    Initializes ``path`` (default: the configured database). If
+    ``EVENTFINDER_DB_AUTOREPAIR`` is set to a truthy value ("1", "true",
     "yes"), a corrupted SQLite file will be backed up and recreated.
     """
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    db_path = path or _default_path()
+    db_path.parent.mkdir(parents=True, exist_ok=True)
 
     need_repair = False
-    if DB_PATH.exists():
+    if db_path.exists():
         try:
-            with _connect() as c:
+            with _connect(db_path) as c:
                 need_repair = not _integrity_ok(c)
         except sqlite3.DatabaseError:
             need_repair = True
 
     if need_repair and str(os.getenv("EVENTFINDER_DB_AUTOREPAIR", "")).lower() in {"1", "true", "yes"}:
         try:
-            backup = DB_PATH.with_name(DB_PATH.name + f".bak-{time.strftime('%Y%m%d%H%M%S')}")
-            DB_PATH.rename(backup)
+            stamp = time.strftime("%Y%m%d%H%M%S")
+            backup = db_path.with_name(f"{db_path.name}.bak-{stamp}")
+            db_path.rename(backup)
         except Exception:
             # If we cannot rename, fall back to removing the corrupted file
             try:
-                DB_PATH.unlink(missing_ok=True)
+                db_path.unlink(missing_ok=True)
             except Exception:
                 pass
-        with _connect() as conn:
+        with _connect(db_path) as conn:
             _create_schema(conn)
         return
 
     # Normal path (no repair, or file absent): ensure schema exists
-    with _connect() as conn:
+    with _connect(db_path) as conn:
         _create_schema(conn)
@@ -4,36 +4,49 @@ This module wires middleware, routers, and startup hooks.
 Use ``uvicorn app.main:app --reload --port 8001`` to run the API locally.
 """
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
 import sqlite3
-from typing import AsyncIterator
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
 
 from fastapi import Depends, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, RedirectResponse
 
-from .core.config import settings
-from .core.database import get_db, init_db
 from .api.routes import events as events_router
 from .api.routes import meta as meta_router
+from .core.config import get_settings
+from .core.database import ConnectionPool, get_db, init_db, optimize_db
 
 
 @asynccontextmanager
-async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
     logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
-    init_db()
+    pool: ConnectionPool = app.state.pool
+    init_db(pool.path)
+    pool.open()
     logging.getLogger(__name__).info("DB initialized and ready")
-    yield
+    try:
+        yield
+    finally:
+        pool.close()
+        optimize_db(pool.path)
 
 
-def create_app() -> FastAPI:
+def create_app(db_path: Path | None = None) -> FastAPI:
     """Create and configure the FastAPI application.
 
+    Args:
+        db_path: SQLite file to serve; defaults to ``EVENTFINDER_DATABASE_PATH``.
+
     Returns:
         FastAPI: A configured FastAPI instance with CORS, routes, and startup.
     """
+    settings = get_settings()
     app = FastAPI(title=settings.app_name, lifespan=_lifespan)
+    app.state.pool = ConnectionPool(Path(db_path or settings.database_path))
 
     app.add_middleware(
         CORSMiddleware,
@@ -41,29 +54,27 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
-        expose_headers=["X-Total-Count"],
+        expose_headers=["X-Total-Count", "X-Next-Cursor"],
     )
 
     @app.get("/health")
-    def health() -> dict:
+    async def health() -> dict:
         """Simple liveness endpoint used by monitors and tests."""
         return {"status": "ok"}
     
     @app.head("/health")
-    def health_head() -> JSONResponse:
+    async def health_head() -> JSONResponse:
         return JSONResponse(status_code=200, content=None)
 
     @app.get("/ready")
-    def ready(conn: sqlite3.Connection = Depends(get_db)) -> dict:
+    async def ready(conn: sqlite3.Connection = Depends(get_db)) -> dict:
         """Readiness probe that verifies the app can talk to SQLite.
 
         Returns 200 with status ok when a trivial DB query succeeds; 503 otherwise.
         Suitable for container orchestrator health checks (e.g., Render).
         """
         try:
-            cur = conn.cursor()
-            cur.execute("SELECT 1")
-            _ = cur.fetchone()
+            await asyncio.to_thread(lambda: conn.execute("SELECT 1").fetchone())
             return {"status": "ok", "db": "ok"}
         except Exception:
             # Avoid leaking internals in readiness path
@@ -71,11 +82,11 @@ def create_app() -> FastAPI:
 
     # Some platforms may probe HEAD; respond success without body
     @app.head("/ready")
-    def ready_head() -> JSONResponse:
+    async def ready_head() -> JSONResponse:
         return JSONResponse(status_code=200, content=None)
 
     @app.get("/", include_in_schema=False)
-    def root() -> RedirectResponse:
+    async def root() -> RedirectResponse:
         """Redirect the API root to the interactive Swagger docs."""
         return RedirectResponse(url="/docs", status_code=307)
 
@@ -2,25 +2,33 @@
 
 Contains thin, well-typed helpers that translate between SQLite rows and
 Pydantic models and construct SQL for filtering, sorting, and pagination.
+Write helpers don't commit: the caller (``run_and_commit`` in the routes, or
+``db_session``) owns the transaction.
 """
 
 from __future__ import annotations
 
 import re
 import sqlite3
-from typing import Any, List, Optional
+from collections.abc import Iterable, Sequence
+from typing import Any
 
+from ..core.database import FTS_INSERT_TRIGGER
 from ..schemas.event import (
+    CategoryEnum,
     EventCreate,
+    EventFilter,
     EventOut,
-    EventQuery,
     EventUpdate,
-    SortEnum,
-    CategoryEnum,
+    SortValue,
 )
 
 
 def _fts_available(conn: sqlite3.Connection) -> bool:
+    # Pooled connections probe once at connect time; plain ones probe here.
+    cached = getattr(conn, "fts_available", None)
+    if cached is not None:
+        return bool(cached)
     cur = conn.cursor()
     try:
         cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='events_fts'")
@@ -41,156 +49,334 @@ def _to_fts_query(text: str) -> str:
     return " AND ".join(f"{t}*" for t in tokens)
 
 
-def row_to_event(row: sqlite3.Row) -> EventOut:
-    """Convert a SQLite Row into an EventOut model."""
-    return EventOut(
-        id=row["id"],
-        title=row["title"],
-        description=row["description"],
-        location=row["location"],
-        category=row["category"],
-        date=row["date"],
-        created_at=row["created_at"],
-    )
+# Column order matters: EventOut.from_row reads rows positionally.
+_COLUMNS = (
+    "events.id, events.title, events.description, events.location,"
+    " events.category, events.date, events.created_at"
+)
+# Same columns for ``RETURNING``, which doesn't accept table-qualified names.
+_RETURNING = "RETURNING id, title, description, location, category, date, created_at"
+# INSERT/UPDATE ... RETURNING needs SQLite 3.35+; older builds re-select the row.
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
 
 
 def insert_event(conn: sqlite3.Connection, data: EventCreate) -> EventOut:
     """Insert a new event and return the persisted record."""
+    sql = (
+        "INSERT INTO events (title, description, location, category, date)"
+        " VALUES (?, ?, ?, ?, ?)"
+    )
+    params = (
+        data.title,
+        data.description,
+        data.location,
+        data.category.value,
+        data.date.isoformat(),
+    )
     cur = conn.cursor()
     try:
-        cur.execute(
-            """
-            INSERT INTO events (title, description, location, category, date)
-            VALUES (?, ?, ?, ?, ?)
-            """,
-            (data.title, data.description, data.location, data.category.value, data.date.isoformat()),
-        )
-        event_id = cur.lastrowid
-        conn.commit()  # Add commit here
-        cur.execute("SELECT * FROM events WHERE id = ?", (event_id,))
+        if _HAS_RETURNING:
+            cur.execute(f"{sql} {_RETURNING}", params)
+        else:
+            cur.execute(sql, params)
+            cur.execute(f"SELECT {_COLUMNS} FROM events WHERE id = ?", (cur.lastrowid,))
         row = cur.fetchone()
-        return row_to_event(row)
-    except Exception as e:
-        conn.rollback()
-        raise e
+        return EventOut.from_row(row)
     finally:
         cur.close()
 
 
-def list_events(conn: sqlite3.Connection, q: EventQuery) -> List[EventOut]:
-    """List events matching search criteria with pagination and sorting."""
-    joins: List[str] = []
-    clauses: List[str] = []
-    params: List[Any] = []
-
-    if q.q:
-        if _fts_available(conn):
-            joins.append("JOIN events_fts fts ON fts.rowid = events.id")
-            clauses.append("fts MATCH ?")
-            params.append(_to_fts_query(q.q))
-        else:
-            clauses.append("(title LIKE ? OR description LIKE ?)")
-            like = f"%{q.q}%"
-            params.extend([like, like])
-    if getattr(q, "starts_with", None):
-        prefix = q.starts_with
-        if prefix is not None:
-            clauses.append("LOWER(title) LIKE ?")
-            params.append(f"{prefix.lower()}%")
-    if q.location:
-        clauses.append("LOWER(location) LIKE ?")
-        params.append(f"%{q.location.lower()}%")
-    if q.category:
-        clauses.append("LOWER(category) = ?")
-        params.append(q.category.value)
-    if q.date:
-        clauses.append("date = ?")
-        params.append(q.date.isoformat())
-    if q.start_date:
-        clauses.append("date >= ?")
-        params.append(q.start_date.isoformat())
-    if q.end_date:
-        clauses.append("date <= ?")
-        params.append(q.end_date.isoformat())
+def bulk_insert_events(conn: sqlite3.Connection, items: Iterable[EventCreate]) -> int:
+    """Insert many validated events at once; see :func:`bulk_insert_rows`."""
+    return bulk_insert_rows(
+        conn,
+        [
+            (e.title, e.description, e.location, e.category.value, e.date.isoformat())
+            for e in items
+        ],
+    )
 
-    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
-    join_sql = " ".join(joins)
-    # Sorting
-    if q.sort == SortEnum.date_desc:
-        order = "ORDER BY date DESC, id DESC"
-    elif q.sort == SortEnum.created_desc:
-        order = "ORDER BY created_at DESC, id DESC"
-    else:
-        order = "ORDER BY date ASC, id ASC"
-    sql = f"SELECT events.* FROM events {join_sql} {where} {order} LIMIT ? OFFSET ?"
-    params.extend([q.limit, q.offset])
 
+def bulk_insert_rows(conn: sqlite3.Connection, rows: Sequence[tuple[Any, ...]]) -> int:
+    """Insert pre-built ``(title, description, location, category, date)`` rows.
+
+    For trusted data only: values are bound as given (category as its enum
+    value, date as an ISO string) without model validation. Uses
+    ``executemany`` with the per-row FTS trigger dropped, then rebuilds the
+    FTS index in one pass. Runs inside a savepoint, so it joins the caller's
+    transaction and rolls back as a whole on error. Returns the row count.
+    """
+    fts = _fts_available(conn)
     cur = conn.cursor()
-    cur.execute(sql, params)
-    rows = cur.fetchall()
-    return [row_to_event(r) for r in rows]
+    cur.execute("SAVEPOINT bulk_insert_events")
+    try:
+        if fts:
+            cur.execute("DROP TRIGGER IF EXISTS events_fts_ai")
+        cur.executemany(
+            "INSERT INTO events (title, description, location, category, date)"
+            " VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        if fts:
+            cur.execute(FTS_INSERT_TRIGGER)
+            cur.execute("INSERT INTO events_fts(events_fts) VALUES('rebuild')")
+        cur.execute("RELEASE bulk_insert_events")
+    except Exception:
+        cur.execute("ROLLBACK TO bulk_insert_events")
+        cur.execute("RELEASE bulk_insert_events")
+        raise
+    finally:
+        cur.close()
+    return len(rows)
 
 
-def count_events(conn: sqlite3.Connection, q: EventQuery) -> int:
-    """Count total events matching the given filters (ignores limit/offset)."""
-    joins: List[str] = []
-    clauses: List[str] = []
-    params: List[Any] = []
+# SQL text per filter shape; values are always bound, so shapes are few and
+# reusing the exact same string also hits sqlite3's statement cache. A single
+# catch-all statement with ``(? IS NULL OR col = ?)`` predicates would need
+# even fewer prepares, but SQLite plans it once for all bindings and can no
+# longer seek the composite indexes, so each shape gets its own text.
+_SQL_TEMPLATES: dict[tuple[Any, ...], str] = {}
+
+
+def _keyset_op(sort: SortValue) -> str:
+    """Comparison applied to the ``(date_i, id)`` cursor for ``sort``."""
+    if sort == "date_desc":
+        return "<"
+    if sort == "date_asc":
+        return ">"
+    raise ValueError("keyset pagination requires a date sort")
+
+
+def _like_escape(text: str) -> str:
+    """Escape ``LIKE`` wildcards for use with ``ESCAPE '\\'``."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _search_plan(
+    conn: sqlite3.Connection, q: EventFilter, keyset: bool = True
+) -> tuple[tuple[Any, ...], list[Any]]:
+    """Return the filter shape (SQL template key) and its bound params.
+
+    Keyword and location filters go through a single FTS MATCH when the index
+    exists and the input has searchable tokens; otherwise they fall back to
+    ``LIKE`` (keyword: substring, location: case-insensitive prefix of any
+    word, like the FTS prefix query; wildcards in the input are escaped). With
+    ``keyset`` the ``after_date``/``after_id`` cursor is applied last.
+    """
+    fts = bool(q.q or q.location) and _fts_available(conn)
+    q_terms = _to_fts_query(q.q) if q.q and fts else ""
+    loc_terms = _to_fts_query(q.location) if q.location and fts else ""
+    q_mode = "fts" if q_terms else "like" if q.q else ""
+    loc_mode = "fts" if loc_terms else "like" if q.location else ""
+
+    params: list[Any] = []
+    match: list[str] = []
+    if q_terms:
+        match.append(f"{{title description}} : ({q_terms})")
+    if loc_terms:
+        match.append(f"location : ({loc_terms})")
+    if match:
+        params.append(" AND ".join(match))
+    if q_mode == "like":
+        like = f"%{q.q}%"
+        params.extend([like, like])
+    if q.starts_with:
+        params.append(q.starts_with.lower())
+    if loc_mode == "like":
+        loc = _like_escape(q.location or "")
+        params.extend([f"{loc}%", f"% {loc}%"])
+    if q.category is not None:
+        params.append(q.category)
+    if q.date is not None:
+        params.append(q.date.toordinal())
+    if q.start_date is not None:
+        params.append(q.start_date.toordinal())
+    if q.end_date is not None:
+        params.append(q.end_date.toordinal())
+    keyset_op = ""
+    if keyset and q.after_date is not None and q.after_id is not None:
+        keyset_op = _keyset_op(q.sort)
+        params.extend([q.after_date.toordinal(), q.after_id])
+
+    shape = (
+        q_mode,
+        loc_mode,
+        bool(q.starts_with),
+        q.category is not None,
+        q.date is not None,
+        q.start_date is not None,
+        q.end_date is not None,
+        keyset_op,
+    )
+    return shape, params
 
-    if q.q:
-        if _fts_available(conn):
-            joins.append("JOIN events_fts fts ON fts.rowid = events.id")
-            clauses.append("fts MATCH ?")
-            params.append(_to_fts_query(q.q))
-        else:
-            clauses.append("(title LIKE ? OR description LIKE ?)")
-            like = f"%{q.q}%"
-            params.extend([like, like])
-    if getattr(q, "starts_with", None):
-        prefix = q.starts_with
-        if prefix is not None:
-            clauses.append("LOWER(title) LIKE ?")
-            params.append(f"{prefix.lower()}%")
-    if q.location:
-        clauses.append("LOWER(location) LIKE ?")
-        params.append(f"%{q.location.lower()}%")
-    if q.category:
-        clauses.append("LOWER(category) = ?")
-        params.append(q.category.value)
-    if q.date:
-        clauses.append("date = ?")
-        params.append(q.date.isoformat())
-    if q.start_date:
-        clauses.append("date >= ?")
-        params.append(q.start_date.isoformat())
-    if q.end_date:
-        clauses.append("date <= ?")
-        params.append(q.end_date.isoformat())
 
+def _build_search_sql(kind: str, sort: SortValue, shape: tuple[Any, ...]) -> str:
+    (
+        q_mode,
+        loc_mode,
+        has_starts,
+        has_cat,
+        has_date,
+        has_start,
+        has_end,
+        keyset_op,
+    ) = shape
+    join_sql = ""
+    clauses: list[str] = []
+    if "fts" in (q_mode, loc_mode):
+        join_sql = "JOIN events_fts ON events_fts.rowid = events.id"
+        clauses.append("events_fts MATCH ?")
+    if q_mode == "like":
+        clauses.append("(title LIKE ? OR description LIKE ?)")
+    if has_starts:
+        clauses.append("title_initial = ?")
+    if loc_mode == "like":
+        clauses.append("(location LIKE ? ESCAPE '\\' OR location LIKE ? ESCAPE '\\')")
+    if has_cat:
+        clauses.append("LOWER(category) = ?")
+    if has_date:
+        clauses.append("date_i = ?")
+    if has_start:
+        clauses.append("date_i >= ?")
+    if has_end:
+        clauses.append("date_i <= ?")
+    if keyset_op:
+        clauses.append(f"(date_i, id) {keyset_op} (?, ?)")
     where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
-    join_sql = " ".join(joins)
-    sql = f"SELECT COUNT(*) AS cnt FROM events {join_sql} {where}"
+
+    if kind == "count":
+        return f"SELECT COUNT(*) AS cnt FROM events {join_sql} {where}"
+    columns = f"{_COLUMNS}, COUNT(*) OVER () AS total" if kind == "window" else _COLUMNS
+    order_by = _order_by(sort, q_mode == "fts")
+    return (
+        f"SELECT {columns} FROM events {join_sql} {where} {order_by}"
+        " LIMIT ? OFFSET ?"
+    )
+
+
+def _search_sql(kind: str, sort: SortValue, shape: tuple[Any, ...]) -> str:
+    """Return the memoized SQL for ``kind`` ("list", "count" or "window")."""
+    key = (kind, sort, shape)
+    sql = _SQL_TEMPLATES.get(key)
+    if sql is None:
+        sql = _SQL_TEMPLATES[key] = _build_search_sql(kind, sort, shape)
+    return sql
+
+
+def _order_by(sort: SortValue, ranked: bool) -> str:
+    if sort == "relevance" and ranked:
+        # events_fts.rank is BM25 (lower is better); ties fall back to date.
+        return "ORDER BY events_fts.rank, date_i ASC, id ASC"
+    if sort == "date_desc":
+        return "ORDER BY date_i DESC, id DESC"
+    if sort == "created_desc":
+        return "ORDER BY created_at DESC, id DESC"
+    return "ORDER BY date_i ASC, id ASC"
+
+
+def _list_rows(
+    conn: sqlite3.Connection, q: EventFilter, shape: tuple[Any, ...], params: list[Any]
+) -> list[sqlite3.Row]:
     cur = conn.cursor()
-    cur.execute(sql, params)
+    cur.execute(_search_sql("list", q.sort, shape), [*params, q.limit, q.offset])
+    return cur.fetchall()
+
+
+def _count_rows(
+    conn: sqlite3.Connection, q: EventFilter, shape: tuple[Any, ...], params: list[Any]
+) -> int:
+    cur = conn.cursor()
+    cur.execute(_search_sql("count", q.sort, shape), params)
     row = cur.fetchone()
     return int(row[0]) if row else 0
 
 
-def get_event(conn: sqlite3.Connection, event_id: int) -> Optional[EventOut]:
+def _without_keyset(
+    shape: tuple[Any, ...], params: list[Any]
+) -> tuple[tuple[Any, ...], list[Any]]:
+    """Drop the cursor from a :func:`_search_plan` result (its params come last)."""
+    if not shape[-1]:
+        return shape, params
+    return shape[:-1] + ("",), params[:-2]
+
+
+def list_events(conn: sqlite3.Connection, q: EventFilter) -> list[EventOut]:
+    """List events matching search criteria with pagination and sorting."""
+    shape, params = _search_plan(conn, q)
+    return [EventOut.from_row(r) for r in _list_rows(conn, q, shape, params)]
+
+
+def row_to_dict(row: Sequence[Any]) -> dict[str, Any]:
+    """Map a :data:`_COLUMNS` row to the JSON shape of :class:`EventOut`.
+
+    Stored values are already JSON-ready (ISO ``date``/``created_at`` strings,
+    category values), so list responses can be serialized straight from these
+    dicts without building models.
+    """
+    return {
+        "title": row[1],
+        "description": row[2],
+        "location": row[3],
+        "category": row[4],
+        "date": row[5],
+        "id": row[0],
+        "created_at": row[6],
+    }
+
+
+def count_events(conn: sqlite3.Connection, q: EventFilter) -> int:
+    """Count total events matching the given filters (ignores limit/offset/cursor)."""
+    shape, params = _search_plan(conn, q, keyset=False)
+    return _count_rows(conn, q, shape, params)
+
+
+def search_and_count(
+    conn: sqlite3.Connection, q: EventFilter
+) -> tuple[list[dict[str, Any]], int]:
+    """Return one page of matching events plus the total match count.
+
+    Rows are shaped by :func:`row_to_dict`.
+
+    Full-text searches use ``COUNT(*) OVER ()`` so the (expensive) MATCH is
+    evaluated once for both the page and the total. Other filters keep two
+    statements: the count is an index-only scan and the page is a short index
+    range walk, which is cheaper than materializing and re-sorting every match
+    for the window. Cursor pages also use two statements, since the total must
+    ignore the cursor. The plan is built once and shared by both statements.
+    """
+    shape, params = _search_plan(conn, q)
+    if "fts" not in shape[:2] or shape[-1]:
+        rows = _list_rows(conn, q, shape, params)
+        total = _count_rows(conn, q, *_without_keyset(shape, params))
+        return [row_to_dict(r) for r in rows], total
+
+    cur = conn.cursor()
+    cur.execute(_search_sql("window", q.sort, shape), [*params, q.limit, q.offset])
+    rows = cur.fetchall()
+    if not rows:
+        # Past the last page there is no row to carry the window total.
+        return [], _count_rows(conn, q, shape, params) if q.offset else 0
+    return [row_to_dict(r) for r in rows], int(rows[0]["total"])
+
+
+def get_event(conn: sqlite3.Connection, event_id: int) -> EventOut | None:
     """Fetch a single event by ID, or None if not found."""
     cur = conn.cursor()
-    cur.execute("SELECT * FROM events WHERE id = ?", (event_id,))
+    cur.execute(f"SELECT {_COLUMNS} FROM events WHERE id = ?", (event_id,))
     row = cur.fetchone()
-    return row_to_event(row) if row else None
+    return EventOut.from_row(row) if row else None
 
 
-def update_event(conn: sqlite3.Connection, event_id: int, updates: EventUpdate) -> Optional[EventOut]:
+def update_event(
+    conn: sqlite3.Connection, event_id: int, updates: EventUpdate
+) -> EventOut | None:
     """Apply partial updates and return the updated event or None if not found."""
     data = updates.model_dump(exclude_unset=True)
     if not data:
         return get_event(conn, event_id)
     fields = []
-    params: List[Any] = []
+    params: list[Any] = []
     if "title" in data:
         fields.append("title = ?")
         params.append(data["title"])
@@ -218,16 +404,15 @@ def update_event(conn: sqlite3.Connection, event_id: int, updates: EventUpdate)
     sql = f"UPDATE events SET {', '.join(fields)} WHERE id = ?"
     cur = conn.cursor()
     try:
-        cur.execute(sql, params)
-        conn.commit()  # Add commit here
-        if cur.rowcount == 0:
-            return None
-        cur.execute("SELECT * FROM events WHERE id = ?", (event_id,))
+        if _HAS_RETURNING:
+            cur.execute(f"{sql} {_RETURNING}", params)
+        else:
+            cur.execute(sql, params)
+            if cur.rowcount == 0:
+                return None
+            cur.execute(f"SELECT {_COLUMNS} FROM events WHERE id = ?", (event_id,))
         row = cur.fetchone()
-        return row_to_event(row) if row else None
-    except Exception as e:
-        conn.rollback()
-        raise e
+        return EventOut.from_row(row) if row else None
     finally:
         cur.close()
 
@@ -237,10 +422,6 @@ def delete_event(conn: sqlite3.Connection, event_id: int) -> bool:
     cur = conn.cursor()
     try:
         cur.execute("DELETE FROM events WHERE id = ?", (event_id,))
-        conn.commit()  # Add commit here - this was the main issue!
         return cur.rowcount > 0
-    except Exception as e:
-        conn.rollback()  # Rollback on error
-        raise e
     finally:
-        cur.close()  # Clean up cursor
+        cur.close()
@@ -1,16 +1,24 @@
 """Pydantic models and enums for Events domain.
 
-These schemas define request/response models and search parameters, and provide
+These schemas define request/response models and search filters, and provide
 validators to normalize and sanitize common fields.
 """
 
 from __future__ import annotations
 
 import datetime as dt
+from collections.abc import Sequence
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    StringConstraints,
+    TypeAdapter,
+)
 
 
 class CategoryEnum(str, Enum):
@@ -23,38 +31,52 @@ class CategoryEnum(str, Enum):
     community = "community"
 
 
+# Plain-string form of CategoryEnum for query parameters and filters, which only
+# need the value; keep in step with the enum members.
+CategoryValue = Literal["music", "tech", "sports", "arts", "business", "community"]
+# Supported sorting modes for event listing.
+SortValue = Literal["date_asc", "date_desc", "created_desc", "relevance"]
+
+
+_CAT_LOOKUP: dict[str, CategoryEnum] = {m.value: m for m in CategoryEnum}
+
+
+def _normalize_category(v: Any) -> Any:
+    """Normalize category strings to lower-case enum values.
+
+    Unknown values are passed through unchanged so the enum validator reports
+    them with the list of allowed categories.
+    """
+    if isinstance(v, str):
+        return _CAT_LOOKUP.get(v.strip().lower(), v)
+    return v
+
+
+# Shared field types: the normalization lives in the core schema once instead
+# of as a validator method on every model. Text is stripped by pydantic-core
+# itself (no Python callback) before the length check.
+Title = Annotated[str, StringConstraints(strip_whitespace=True, max_length=200)]
+Description = Annotated[str, StringConstraints(strip_whitespace=True, max_length=2000)]
+Location = Annotated[str, StringConstraints(strip_whitespace=True, max_length=200)]
+NormalizedCategory = Annotated[CategoryEnum, BeforeValidator(_normalize_category)]
+
+
 class EventBase(BaseModel):
     """Shared fields for events.
 
     All text inputs are stripped, and ``category`` is normalized to lowercase
     and validated against :class:`CategoryEnum`.
     """
-    title: str = Field(..., max_length=200)
-    description: Optional[str] = Field(None, max_length=2000)
-    location: str = Field(..., max_length=200)
-    category: CategoryEnum
+    # Build validators on first use, so processes that never touch a model
+    # (e.g. the seed script) skip its core schema build.
+    model_config = ConfigDict(defer_build=True)
+
+    title: Title
+    description: Description | None = None
+    location: Location
+    category: NormalizedCategory
     date: dt.date
 
-    @field_validator("title", "location", "description", mode="before")
-    @classmethod
-    def _strip_text(cls, v):
-        """Trim whitespace from textual fields if provided."""
-        if v is None:
-            return v
-        if isinstance(v, str):
-            return v.strip()
-        return v
-
-    @field_validator("category", mode="before")
-    @classmethod
-    def _normalize_category(cls, v):
-        """Normalize category strings to lower-case enum values."""
-        if v is None:
-            return v
-        if isinstance(v, str):
-            return CategoryEnum(v.strip().lower())
-        return v
-
 
 class EventCreate(EventBase):
     """Payload for creating a new event."""
@@ -66,66 +88,63 @@ class EventOut(EventBase):
     model_config = ConfigDict(from_attributes=True)
 
     id: int
-    created_at: str
-
-
-class SortEnum(str, Enum):
-    """Supported sorting modes for event listing."""
-    date_asc = "date_asc"
-    date_desc = "date_desc"
-    created_desc = "created_desc"
-
-
-class EventQuery(BaseModel):
-    """Search and pagination options for listing events."""
-    q: Optional[str] = None
-    location: Optional[str] = None
-    date: Optional[dt.date] = None
-    category: Optional[CategoryEnum] = None
-    start_date: Optional[dt.date] = None
-    end_date: Optional[dt.date] = None
-    limit: int = Field(20, ge=1, le=100)
-    offset: int = Field(0, ge=0)
-    sort: SortEnum = SortEnum.date_asc
-    # Optional first-letter title filter used by the API route; validates here to keep
-    # the router lean and avoid ad-hoc checks.
-    starts_with: Optional[str] = Field(None, description="Filter by first letter of title (A–Z)")
-
-    @field_validator("starts_with")
+    created_at: dt.datetime
+
     @classmethod
-    def _validate_starts_with(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        v = v.strip()
-        if len(v) != 1 or not v.isalpha():
-            raise ValueError("starts_with must be a single alphabetic character")
-        return v
+    def from_row(cls, row: Sequence[Any]) -> EventOut:
+        """Build from a trusted DB row without running validators.
+
+        ``row`` holds ``id, title, description, location, category, date,
+        created_at`` in that order, as stored by the repository (category as
+        an enum value, ``date`` and ``created_at`` as ISO strings; the
+        timestamp's ``Z`` suffix parses to UTC).
+        """
+        return cls.model_construct(
+            id=row[0],
+            title=row[1],
+            description=row[2],
+            location=row[3],
+            category=CategoryEnum(row[4]),
+            date=dt.date.fromisoformat(row[5]),
+            created_at=dt.datetime.fromisoformat(row[6]),
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class EventFilter:
+    """Search and pagination options for listing events.
+
+    A plain dataclass rather than a model: the route has already validated
+    and coerced every value via its query parameters.
+    """
+    q: str | None = None
+    location: str | None = None
+    date: dt.date | None = None
+    category: CategoryValue | None = None
+    start_date: dt.date | None = None
+    end_date: dt.date | None = None
+    limit: int = 20
+    offset: int = 0
+    sort: SortValue = "date_asc"
+    # Optional single-letter title filter (A–Z)
+    starts_with: str | None = None
+    # Keyset cursor for date sorts: continue after the event with this (date, id).
+    after_date: dt.date | None = None
+    after_id: int | None = None
 
 
 class EventUpdate(BaseModel):
     """Partial update payload for events."""
-    title: Optional[str] = Field(None, max_length=200)
-    description: Optional[str] = Field(None, max_length=2000)
-    location: Optional[str] = Field(None, max_length=200)
-    category: Optional[CategoryEnum] = None
-    date: Optional[dt.date] = None
+    model_config = ConfigDict(defer_build=True)
 
-    @field_validator("title", "location", "description", mode="before")
-    @classmethod
-    def _strip_text(cls, v):
-        """Trim whitespace from textual fields if provided."""
-        if v is None:
-            return v
-        if isinstance(v, str):
-            return v.strip()
-        return v
-
-    @field_validator("category", mode="before")
-    @classmethod
-    def _normalize_category(cls, v):
-        """Normalize category strings to lower-case enum values."""
-        if v is None:
-            return v
-        if isinstance(v, str):
-            return CategoryEnum(v.strip().lower())
-        return v
+    title: Title | None = None
+    description: Description | None = None
+    location: Location | None = None
+    category: NormalizedCategory | None = None
+    date: dt.date | None = None
+
+
+# Module-level adapters so callers validating many payloads (seeding, raw
+# request bodies) reuse one compiled validator instead of building their own.
+event_create_adapter: TypeAdapter[EventCreate] = TypeAdapter(EventCreate)
+event_update_adapter: TypeAdapter[EventUpdate] = TypeAdapter(EventUpdate)
@@ -1,18 +1,28 @@
-import importlib
-import os
-import sys
+import asyncio
 import warnings
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
 
-ROOT_DIR = Path(__file__).resolve().parents[1]
-if str(ROOT_DIR) not in sys.path:
-    sys.path.insert(0, str(ROOT_DIR))
+from app.main import create_app
 
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
 
+def pytest_asyncio_loop_factories(config: pytest.Config, item: pytest.Item):
+    # Run async tests on uvloop (installed with uvicorn[standard]) when
+    # available, matching how the app is served.
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
 @pytest.fixture(scope="session")
 def test_db_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
     # Create a temporary SQLite file for the test session
@@ -20,17 +30,21 @@ def test_db_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
 
 
 @pytest.fixture(scope="session")
-def app(test_db_path: Path):
-    # Point the app at the test DB before importing modules that read the env
-    os.environ["EVENTFINDER_DATABASE_PATH"] = str(test_db_path)
-
-    # Reload config and database so they pick up the env var
-    from app.core import config as cfg
-    from app.core import database as db
-    importlib.reload(cfg)
-    importlib.reload(db)
-
-    # Now import and construct the FastAPI app
-    from app import main as main_module
-    importlib.reload(main_module)
-    return main_module.create_app()
+def app(test_db_path: Path) -> FastAPI:
+    return create_app(db_path=test_db_path)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    async with app.router.lifespan_context(app):
+        yield
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client(app: FastAPI):
+    # One lifespan and client for the whole session; tests share the
+    # session event loop (see asyncio_default_*_loop_scope in pytest.ini).
+    async with lifespan(app):
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as async_client:
+            yield async_client
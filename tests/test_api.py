@@ -1,26 +1,33 @@
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
+import asyncio
+import json
+import sqlite3
+import threading
 from datetime import date
+from pathlib import Path
+from typing import get_args
 
 import pytest
-import pytest_asyncio
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
-
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    async with app.router.lifespan_context(app):
-        yield
-
-
-@pytest_asyncio.fixture
-async def client(app: FastAPI):
-    async with lifespan(app):
-        transport = ASGITransport(app=app)
-        async with AsyncClient(transport=transport, base_url="http://test") as async_client:
-            yield async_client
+from app.core.database import AppConnection, ConnectionPool, _create_schema
+from app.repositories.events import (
+    _COLUMNS,
+    _search_plan,
+    _search_sql,
+    _without_keyset,
+    bulk_insert_events,
+    list_events,
+)
+from app.schemas.event import (
+    CategoryEnum,
+    CategoryValue,
+    EventCreate,
+    EventFilter,
+    EventOut,
+)
 
 
 @pytest.mark.asyncio
@@ -30,12 +37,20 @@ async def test_health(client: AsyncClient) -> None:
     assert response.json() == {"status": "ok"}
 
 
+@pytest.mark.asyncio
+async def test_ready(client: AsyncClient) -> None:
+    response = await client.get("/ready")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok", "db": "ok"}
+
+
 @pytest.mark.asyncio
 async def test_categories(client: AsyncClient) -> None:
     response = await client.get("/api/meta/categories")
     assert response.status_code == 200
     categories = response.json()
     assert isinstance(categories, list) and "music" in categories
+    assert response.headers["Cache-Control"] == "public, max-age=3600"
 
 
 @pytest.mark.asyncio
@@ -58,12 +73,16 @@ async def test_create_get_and_list_event(client: AsyncClient) -> None:
     assert detail_response.status_code == 200
     fetched = detail_response.json()
     assert fetched["id"] == created["id"]
+    assert fetched["created_at"] == created["created_at"]
+    assert created["created_at"].endswith("Z")
 
     list_response = await client.get("/api/events/?limit=10&offset=0")
     assert list_response.status_code == 200
     assert "X-Total-Count" in list_response.headers
     items = list_response.json()
     assert any(evt["id"] == created["id"] for evt in items)
+    # List rows are serialized straight from the DB; they must match EventOut.
+    assert [evt for evt in items if evt["id"] == created["id"]] == [fetched]
 
 
 @pytest.mark.asyncio
@@ -93,6 +112,30 @@ async def test_update_event_partial(client: AsyncClient) -> None:
     assert fetched["category"] == "music"
 
 
+@pytest.mark.asyncio
+async def test_create_rejects_unknown_category(client: AsyncClient) -> None:
+    payload = {
+        "title": "Mystery",
+        "location": "Lokoja",
+        "category": "Cooking",
+        "date": date.today().isoformat(),
+    }
+    response = await client.post("/api/events/", json=payload)
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "category"]
+
+
+@pytest.mark.asyncio
+async def test_create_rejects_malformed_json(client: AsyncClient) -> None:
+    response = await client.post(
+        "/api/events/",
+        content=b"{not json",
+        headers={"Content-Type": "application/json"},
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body"]
+
+
 @pytest.mark.asyncio
 async def test_delete_event_and_404_after(client: AsyncClient) -> None:
     payload = {
@@ -120,3 +163,444 @@ async def test_update_delete_nonexistent_return_404(client: AsyncClient) -> None
 
     delete_response = await client.delete("/api/events/999999")
     assert delete_response.status_code == 404
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "query",
+    [
+        EventFilter(),
+        EventFilter(sort="date_desc"),
+        EventFilter(sort="created_desc"),
+        EventFilter(category="tech"),
+        EventFilter(category="tech", sort="date_desc"),
+        EventFilter(start_date=date(2024, 1, 1), end_date=date(2030, 1, 1)),
+        EventFilter(starts_with="p"),
+    ],
+)
+async def test_list_query_plan_avoids_temp_sort(
+    client: AsyncClient, test_db_path: Path, query: EventFilter
+) -> None:
+    conn = sqlite3.connect(test_db_path)
+    conn.row_factory = sqlite3.Row
+    statements: list[str] = []
+    conn.set_trace_callback(statements.append)
+    try:
+        list_events(conn, query)
+        sql = next(s for s in reversed(statements) if "ORDER BY" in s)
+        plan = " ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}"))
+    finally:
+        conn.close()
+    assert "USING INDEX" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.asyncio
+async def test_keyword_search_total_count(client: AsyncClient) -> None:
+    for n in range(3):
+        payload = {
+            "title": f"Zanzibar Jazz Night {n}",
+            "description": "Live jazz",
+            "location": "Stone Town",
+            "category": "music",
+            "date": date.today().isoformat(),
+        }
+        assert (await client.post("/api/events/", json=payload)).status_code == 201
+
+    first_page = await client.get("/api/events/?q=zanzibar&limit=2")
+    assert first_page.status_code == 200
+    assert first_page.headers["X-Total-Count"] == "3"
+    assert len(first_page.json()) == 2
+
+    past_end = await client.get("/api/events/?q=zanzibar&limit=2&offset=10")
+    assert past_end.status_code == 200
+    assert past_end.headers["X-Total-Count"] == "3"
+    assert past_end.json() == []
+
+
+@pytest.mark.asyncio
+async def test_event_from_row_matches_validated_model(
+    client: AsyncClient, test_db_path: Path
+) -> None:
+    payload = {
+        "title": "Row Mapping",
+        "description": None,
+        "location": "Kaduna",
+        "category": "arts",
+        "date": date.today().isoformat(),
+    }
+    created = (await client.post("/api/events/", json=payload)).json()
+
+    conn = sqlite3.connect(test_db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        row = conn.execute(
+            f"SELECT {_COLUMNS} FROM events WHERE id = ?", (created["id"],)
+        ).fetchone()
+    finally:
+        conn.close()
+
+    constructed = EventOut.from_row(row)
+    validated = EventOut.model_validate(dict(row))
+    assert constructed.model_dump() == validated.model_dump()
+
+
+@pytest.mark.asyncio
+async def test_keyword_search_ranks_title_matches_first(client: AsyncClient) -> None:
+    base = {"location": "Jos", "category": "arts", "date": date.today().isoformat()}
+    desc_hit = await client.post(
+        "/api/events/",
+        json={**base, "title": "Pottery Fair", "description": "Quokka themed"},
+    )
+    title_hit = await client.post(
+        "/api/events/", json={**base, "title": "Quokka Parade", "description": "Floats"}
+    )
+    assert desc_hit.status_code == title_hit.status_code == 201
+
+    response = await client.get("/api/events/?q=quokka")
+    assert response.status_code == 200
+    assert [evt["id"] for evt in response.json()] == [
+        title_hit.json()["id"],
+        desc_hit.json()["id"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_location_filter_matches_location_words(client: AsyncClient) -> None:
+    base = {"category": "tech", "date": date.today().isoformat()}
+    in_town = await client.post(
+        "/api/events/",
+        json={**base, "title": "Dev Day", "location": "Maiduguri, Borno"},
+    )
+    mentions_town = await client.post(
+        "/api/events/",
+        json={**base, "title": "Maiduguri Alumni Call", "location": "Online"},
+    )
+    assert in_town.status_code == mentions_town.status_code == 201
+
+    response = await client.get("/api/events/?location=maidug")
+    assert response.status_code == 200
+    assert [evt["id"] for evt in response.json()] == [in_town.json()["id"]]
+    assert response.headers["X-Total-Count"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_location_like_fallback_matches_fts(
+    client: AsyncClient, test_db_path: Path
+) -> None:
+    payload = {
+        "title": "Harmattan Fair",
+        "location": "Ilorin, Kwara",
+        "category": "arts",
+        "date": "2046-01-01",
+    }
+    created = (await client.post("/api/events/", json=payload)).json()
+
+    # A plain AppConnection reports no FTS, so the repository takes the LIKE path.
+    conn = sqlite3.connect(test_db_path, factory=AppConnection)
+    try:
+        for term, expected in (
+            ("kwara", [created["id"]]),
+            ("ilor", [created["id"]]),
+            ("kw_ra", []),
+            ("%", []),
+        ):
+            via_fts = (
+                await client.get(
+                    "/api/events/", params={"location": term, "date": "2046-01-01"}
+                )
+            ).json()
+            via_like = list_events(
+                conn, EventFilter(location=term, date=date(2046, 1, 1))
+            )
+            assert (
+                [evt["id"] for evt in via_fts]
+                == [evt.id for evt in via_like]
+                == expected
+            ), term
+    finally:
+        conn.close()
+
+
+@pytest.mark.asyncio
+async def test_date_filters(client: AsyncClient) -> None:
+    base = {"title": "Calabar Carnival", "location": "Calabar", "category": "community"}
+    days = ["2031-12-24", "2031-12-26", "2032-01-02"]
+    ids = []
+    for day in days:
+        created = await client.post("/api/events/", json={**base, "date": day})
+        assert created.status_code == 201
+        ids.append(created.json()["id"])
+
+    exact = await client.get("/api/events/?date=2031-12-26")
+    assert [evt["id"] for evt in exact.json()] == [ids[1]]
+
+    ranged = await client.get(
+        "/api/events/?start_date=2031-12-25&end_date=2032-01-02&sort=date_desc"
+    )
+    assert [evt["id"] for evt in ranged.json()] == [ids[2], ids[1]]
+    assert ranged.headers["X-Total-Count"] == "2"
+
+    invalid = await client.get("/api/events/?date=2031-02-30")
+    assert invalid.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_keyset_pagination_follows_next_cursor(client: AsyncClient) -> None:
+    base = {"title": "Owerri Book Club", "location": "Owerri", "category": "arts"}
+    ids = []
+    for day in ["2040-05-02", "2040-05-01", "2040-05-01"]:
+        created = await client.post("/api/events/", json={**base, "date": day})
+        ids.append(created.json()["id"])
+    expected = [ids[1], ids[2], ids[0]]
+
+    url = "/api/events/?start_date=2040-05-01&end_date=2040-05-31&limit=2"
+    first = await client.get(url)
+    assert [evt["id"] for evt in first.json()] == expected[:2]
+    cursor = first.headers["X-Next-Cursor"]
+    assert cursor == f"after_date=2040-05-01&after_id={ids[2]}"
+
+    second = await client.get(f"{url}&{cursor}")
+    assert second.status_code == 200
+    assert [evt["id"] for evt in second.json()] == expected[2:]
+    assert second.headers["X-Total-Count"] == "3"
+    assert "X-Next-Cursor" not in second.headers
+
+    backwards = await client.get(
+        f"{url}&sort=date_desc&after_date=2040-05-02&after_id={ids[0]}"
+    )
+    assert [evt["id"] for evt in backwards.json()] == [ids[2], ids[1]]
+
+    partial = await client.get(f"{url}&after_id={ids[0]}")
+    assert partial.status_code == 422
+    wrong_sort = await client.get(f"{url}&sort=created_desc&{cursor}")
+    assert wrong_sort.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_starts_with_filters_by_title_initial(client: AsyncClient) -> None:
+    base = {"location": "Yola", "category": "sports", "date": "2041-03-03"}
+    hit = await client.post("/api/events/", json={**base, "title": "  xylophone Jam"})
+    miss = await client.post(
+        "/api/events/", json={**base, "title": "Yola Xylophone Jam"}
+    )
+    assert hit.status_code == miss.status_code == 201
+
+    response = await client.get(
+        "/api/events/?starts_with=X&start_date=2041-03-03&end_date=2041-03-03"
+    )
+    assert response.status_code == 200
+    assert [evt["id"] for evt in response.json()] == [hit.json()["id"]]
+
+
+def test_schema_init_indexes_existing_rows() -> None:
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE events (id INTEGER PRIMARY KEY AUTOINCREMENT,"
+        " title TEXT NOT NULL, description TEXT, location TEXT NOT NULL,"
+        " category TEXT NOT NULL, date TEXT NOT NULL,"
+        " created_at TEXT NOT NULL DEFAULT '')"
+    )
+    conn.execute(
+        "CREATE VIRTUAL TABLE events_fts USING fts5(title, description,"
+        " content='events', content_rowid='id')"
+    )
+    conn.execute(
+        "INSERT INTO events (title, location, category, date)"
+        " VALUES ('Legacy Gala', 'Benin City', 'arts', '2024-02-02')"
+    )
+    conn.commit()
+
+    _create_schema(conn)
+
+    matches = conn.execute(
+        "SELECT rowid FROM events_fts WHERE events_fts MATCH 'location : benin*'"
+    ).fetchall()
+    assert matches == [(1,)]
+    assert not conn.in_transaction
+    conn.close()
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_events_are_searchable(
+    client: AsyncClient, test_db_path: Path
+) -> None:
+    items = [
+        EventCreate(
+            title=f"Warri Regatta {n}",
+            location="Warri",
+            category="sports",
+            date=date(2042, 1, n),
+        )
+        for n in range(1, 4)
+    ]
+    conn = sqlite3.connect(test_db_path)
+    try:
+        assert bulk_insert_events(conn, items) == 3
+        assert not conn.in_transaction
+        trigger = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='trigger' AND name='events_fts_ai'"
+        )
+        assert trigger.fetchone() is not None
+    finally:
+        conn.close()
+
+    response = await client.get("/api/events/?q=regatta")
+    assert response.status_code == 200
+    assert response.headers["X-Total-Count"] == "3"
+
+    single = await client.post(
+        "/api/events/",
+        json={
+            "title": "Regatta Afterparty",
+            "location": "Warri",
+            "category": "music",
+            "date": "2042-01-04",
+        },
+    )
+    assert single.status_code == 201
+    assert (await client.get("/api/events/?q=regatta")).headers["X-Total-Count"] == "4"
+
+
+def test_pool_close_reaches_checked_out_connections(tmp_path: Path) -> None:
+    pool = ConnectionPool(tmp_path / "pool.db", min_size=1, max_size=3)
+    pool.open()
+    returned, kept = pool.acquire(), pool.acquire()
+    threading.Timer(0.05, pool.release, args=(returned,)).start()
+
+    pool.close(timeout=0.2)
+
+    for conn in (returned, kept):
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    pool.release(kept)  # a late release after close is ignored
+
+
+def test_category_literal_matches_enum() -> None:
+    assert get_args(CategoryValue) == tuple(c.value for c in CategoryEnum)
+
+
+def test_count_plan_is_the_list_plan_without_cursor() -> None:
+    conn = sqlite3.connect(":memory:")
+    query = EventFilter(
+        category="tech", sort="date_desc", after_date=date(2030, 1, 1), after_id=7
+    )
+    assert _without_keyset(*_search_plan(conn, query)) == _search_plan(
+        conn, query, keyset=False
+    )
+    conn.close()
+
+
+def test_search_sql_is_shared_across_filter_values() -> None:
+    conn = sqlite3.connect(":memory:")
+    first = EventFilter(category="tech", start_date=date(2025, 1, 1), limit=5)
+    second = EventFilter(
+        category="music", start_date=date(2026, 6, 1), limit=50, offset=10
+    )
+    (shape_a, params_a), (shape_b, params_b) = (
+        _search_plan(conn, first),
+        _search_plan(conn, second),
+    )
+    conn.close()
+
+    assert params_a != params_b
+    assert _search_sql("list", first.sort, shape_a) is _search_sql(
+        "list", second.sort, shape_b
+    )
+
+
+@pytest.mark.asyncio
+async def test_keyword_search_folds_accents_and_matches_partial_words(
+    client: AsyncClient,
+) -> None:
+    payload = {
+        "title": "Café Dancing Festival",
+        "location": "Akure",
+        "category": "arts",
+        "date": "2043-07-07",
+    }
+    created = await client.post("/api/events/", json=payload)
+    assert created.status_code == 201
+
+    for term in ("cafe", "CAFÉ", "festiva", "festival"):
+        response = await client.get(f"/api/events/?q={term}&date=2043-07-07")
+        assert [evt["id"] for evt in response.json()] == [created.json()["id"]], term
+
+
+@pytest.mark.asyncio
+async def test_concurrent_patches_wait_for_the_write_lock(client: AsyncClient) -> None:
+    payload = {
+        "title": "Busy Writers",
+        "location": "Owerri",
+        "category": "tech",
+        "date": "2044-01-01",
+    }
+    created = (await client.post("/api/events/", json=payload)).json()
+
+    responses = await asyncio.gather(
+        *(
+            client.patch(
+                f"/api/events/{created['id']}", json={"title": f"Busy Writers {i}"}
+            )
+            for i in range(8)
+        )
+    )
+    assert [r.status_code for r in responses] == [200] * 8
+
+
+@pytest.mark.asyncio
+async def test_failed_commit_is_not_reported_as_success(
+    app: FastAPI, client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def failing_commit(self: AppConnection) -> None:
+        raise sqlite3.OperationalError("disk I/O error")
+
+    payload = {
+        "title": "Lost Write",
+        "location": "Yola",
+        "category": "arts",
+        "date": "2045-05-05",
+    }
+    monkeypatch.setattr(AppConnection, "commit", failing_commit)
+    # ``client`` already runs the app's lifespan; this one only reports
+    # server errors as responses.
+    transport = ASGITransport(app=app, raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://test") as raw_client:
+        response = await raw_client.post("/api/events/", json=payload)
+    monkeypatch.undo()
+
+    assert response.status_code >= 500
+    listed = await client.get("/api/events/?date=2045-05-05")
+    assert listed.headers["X-Total-Count"] == "0"
+
+
+@pytest.mark.asyncio
+async def test_slow_request_body_does_not_hold_the_write_lock(
+    client: AsyncClient,
+) -> None:
+    payload = {
+        "title": "Slow Upload",
+        "location": "Jos",
+        "category": "tech",
+        "date": "2045-06-06",
+    }
+    created = (await client.post("/api/events/", json=payload)).json()
+
+    async def slow_body():
+        await asyncio.sleep(0.5)
+        yield json.dumps(payload).encode()
+
+    upload = asyncio.create_task(
+        client.post(
+            "/api/events/",
+            content=slow_body(),
+            headers={"Content-Type": "application/json"},
+        )
+    )
+    await asyncio.sleep(0.1)  # the upload has its connection and is waiting on the body
+    patched = await client.patch(
+        f"/api/events/{created['id']}", json={"title": "Not Blocked"}
+    )
+    assert patched.status_code == 200
+    assert not upload.done()
+    assert (await upload).status_code == 201